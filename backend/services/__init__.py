@@ -5,7 +5,8 @@ Content Localization & AI Tutorial Platform
 """
 
 from .pricing import PricingCalculator, PricingConfig, PricingResult, calculate_job_price
-from .job_service import JobService, JobLockResult, JobSubmitResult, JobStatus, UserRole, UserRank
+from .job_service import JobService, JobLockResult, JobSubmitResult, SubmissionTextResult, JobStatus, UserRole, UserRank
+from .reporting import ReportingService, DashboardStats, CtvEarnings
 
 __all__ = [
     # Pricing
@@ -18,7 +19,13 @@ __all__ = [
     "JobService",
     "JobLockResult",
     "JobSubmitResult",
+    "SubmissionTextResult",
     "JobStatus",
     "UserRole",
     "UserRank",
+    
+    # Reporting
+    "ReportingService",
+    "DashboardStats",
+    "CtvEarnings",
 ]
@@ -6,15 +6,23 @@ Handles job operations including locking, releasing, and submissions.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Iterable, Iterator, Union
 from datetime import datetime
 from enum import Enum
+import hashlib
 import json
 
 # Assuming Supabase client is configured elsewhere
 # from supabase import create_client, Client
 
 
+# Characters per chunk when streaming translated text to the database.
+# Text longer than this is uploaded in chunks instead of in one RPC call.
+# It is also the largest chunk append_submission_chunk() accepts; an
+# upload may have at most 256 chunks.
+SUBMISSION_CHUNK_SIZE = 64 * 1024
+
+
 class JobStatus(str, Enum):
     """Job lifecycle status."""
     AVAILABLE = "available"
@@ -85,6 +93,26 @@ class JobSubmitResult:
         }
 
 
+@dataclass
+class SubmissionTextResult:
+    """One page of a submission's translated text."""
+    text: Optional[str]
+    offset: int
+    total_length: int
+    
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.text or "") < self.total_length
+    
+    def to_dict(self) -> dict:
+        return {
+            "text": self.text,
+            "offset": self.offset,
+            "total_length": self.total_length,
+            "has_more": self.has_more,
+        }
+
+
 class JobService:
     """
     Service layer for job operations.
@@ -194,6 +222,11 @@ class JobService:
         """
         Submit work for a locked job.
         
+        The text is stored deduplicated in `submission_contents` and the
+        submission row references it. Translations longer than
+        `SUBMISSION_CHUNK_SIZE` are sent through `submit_job_streamed()`
+        instead of in a single call.
+        
         Args:
             job_id: UUID of the job to submit.
             translated_text: Translated content text.
@@ -203,6 +236,14 @@ class JobService:
         Returns:
             JobSubmitResult with success status and submission ID.
         """
+        if translated_text is not None and len(translated_text) > SUBMISSION_CHUNK_SIZE:
+            return await self.submit_job_streamed(
+                job_id=job_id,
+                translated_text=translated_text,
+                video_url=video_url,
+                notes=notes,
+            )
+        
         try:
             response = await self.client.rpc('submit_job', {
                 'p_job_id': job_id,
@@ -233,6 +274,150 @@ class JobService:
                 error="SYSTEM_ERROR",
             )
     
+    async def submit_job_streamed(
+        self,
+        job_id: str,
+        translated_text: Union[str, Iterable[str]],
+        video_url: Optional[str] = None,
+        notes: Optional[str] = None,
+        chunk_size: int = SUBMISSION_CHUNK_SIZE,
+    ) -> JobSubmitResult:
+        """
+        Submit work for a locked job, uploading the text in chunks.
+        
+        The text is stored compressed in `submission_contents` and the
+        submission row only references it. When a full string is given, its
+        hash is announced up front so an unchanged resubmission (e.g. after
+        `rejected`) skips the upload entirely.
+        
+        Args:
+            job_id: UUID of the job to submit.
+            translated_text: Translated text, or an iterable of text pieces
+                (e.g. a file opened in text mode) to avoid holding it all in memory.
+            video_url: URL to the re-recorded video.
+            notes: Additional notes for the reviewer.
+            chunk_size: Characters per uploaded chunk, at most `SUBMISSION_CHUNK_SIZE`.
+        
+        Returns:
+            JobSubmitResult with success status and submission ID.
+        """
+        try:
+            content_hash = None
+            if isinstance(translated_text, str):
+                content_hash = hashlib.sha256(translated_text.encode('utf-8')).hexdigest()
+            
+            response = await self.client.rpc('begin_submission_upload', {
+                'p_job_id': job_id,
+                'p_content_hash': content_hash,
+            }).execute()
+            result = response.data
+            
+            if not result.get('success'):
+                return JobSubmitResult(
+                    success=False,
+                    message=result.get('message', 'Failed to start upload'),
+                    error=result.get('error'),
+                )
+            
+            upload_id = result.get('upload_id')
+            content_id = result.get('content_id')
+            chunk_count = None
+            
+            if not result.get('deduplicated'):
+                hasher = hashlib.sha256()
+                chunk_count = 0
+                
+                for chunk in _iter_chunks(translated_text, chunk_size):
+                    hasher.update(chunk.encode('utf-8'))
+                    response = await self.client.rpc('append_submission_chunk', {
+                        'p_upload_id': upload_id,
+                        'p_chunk_index': chunk_count,
+                        'p_data': chunk,
+                    }).execute()
+                    chunk_result = response.data
+                    
+                    if not chunk_result.get('success'):
+                        return JobSubmitResult(
+                            success=False,
+                            message=chunk_result.get('message', 'Failed to upload chunk'),
+                            error=chunk_result.get('error'),
+                        )
+                    chunk_count += 1
+                
+                content_hash = hasher.hexdigest()
+            
+            response = await self.client.rpc('submit_job_content', {
+                'p_job_id': job_id,
+                'p_content_hash': content_hash,
+                'p_upload_id': upload_id,
+                'p_content_id': content_id,
+                'p_chunk_count': chunk_count,
+                'p_video_url': video_url,
+                'p_notes': notes,
+            }).execute()
+            result = response.data
+            
+            if result.get('success'):
+                return JobSubmitResult(
+                    success=True,
+                    message=result.get('message', 'Job submitted successfully'),
+                    submission_id=result.get('submission_id'),
+                )
+            else:
+                return JobSubmitResult(
+                    success=False,
+                    message=result.get('message', 'Failed to submit job'),
+                    error=result.get('error'),
+                )
+                
+        except Exception as e:
+            return JobSubmitResult(
+                success=False,
+                message=f"System error: {str(e)}",
+                error="SYSTEM_ERROR",
+            )
+    
+    async def get_submission_text(
+        self,
+        submission_id: str,
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> SubmissionTextResult:
+        """
+        Load the translated text of a submission on demand.
+        
+        Submission rows only reference their content, so review pages
+        should call this when the text is actually displayed.
+        
+        Args:
+            submission_id: UUID of the submission.
+            offset: Character offset to start reading from.
+            length: Maximum number of characters to return (None = rest).
+        
+        Returns:
+            SubmissionTextResult with the requested text (None if the
+            submission has no text) and the total length, so callers paging
+            with `offset`/`length` know when they have reached the end.
+        
+        Raises:
+            Exception: If the submission is missing or not visible to the caller.
+        """
+        response = await self.client.rpc('get_submission_content', {
+            'p_submission_id': submission_id,
+            'p_offset': offset,
+            'p_length': length,
+        }).execute()
+        result = response.data
+        
+        if not result.get('success'):
+            raise Exception(result.get('message', 'Failed to load submission content'))
+        
+        return SubmissionTextResult(
+            text=result.get('text'),
+            offset=int(result.get('offset') or 0),
+            total_length=int(result.get('total_length') or 0),
+        )
+    
     async def get_available_jobs(
         self,
         limit: int = 20,
@@ -258,6 +443,42 @@ class JobService:
         response = await query.range(offset, offset + limit - 1).execute()
         return response.data
     
+    async def search_jobs(
+        self,
+        query: str,
+        status: Optional[str] = JobStatus.AVAILABLE.value,
+        complexity: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[dict]:
+        """
+        Search jobs by title, description and AI metadata.
+        
+        Calls the database function `search_jobs()`, which matches the
+        indexed full-text vector (title, description, `ai_tools_used`,
+        `tutorial_type`, `model_links`). When nothing matches, it falls back
+        to trigram similarity on title and tool names, so partial words
+        like "comfy" still match "ComfyUI".
+        
+        Args:
+            query: Search terms, e.g. "Stable Diffusion". Empty lists newest jobs.
+            status: Filter by job status (None = any status visible to the caller).
+            complexity: Optional filter by complexity level.
+            limit: Maximum number of jobs to return.
+            offset: Offset for pagination.
+        
+        Returns:
+            List of job dictionaries ordered by relevance, each with a `rank`.
+        """
+        response = await self.client.rpc('search_jobs', {
+            'p_query': query,
+            'p_status': status,
+            'p_complexity': complexity,
+            'p_limit': limit,
+            'p_offset': offset,
+        }).execute()
+        return response.data
+    
     async def get_my_jobs(self, user_id: str) -> List[dict]:
         """
         Get jobs locked by the current user.
@@ -302,6 +523,25 @@ class JobService:
         }
 
 
+def _iter_chunks(text: Union[str, Iterable[str]], chunk_size: int) -> Iterator[str]:
+    """Re-slice a string or stream of strings into chunks of at most `chunk_size` characters."""
+    if isinstance(text, str):
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size]
+        return
+    
+    buffer = ""
+    for piece in text:
+        if buffer:
+            piece = buffer + piece
+        end = len(piece) - len(piece) % chunk_size
+        for start in range(0, end, chunk_size):
+            yield piece[start:start + chunk_size]
+        buffer = piece[end:]
+    if buffer:
+        yield buffer
+
+
 # FastAPI route examples (for reference)
 """
 from fastapi import APIRouter, Depends, HTTPException
@@ -337,6 +577,16 @@ async def submit_job(request: SubmitJobRequest, job_service: JobService = Depend
         raise HTTPException(status_code=400, detail=result.to_dict())
     return result.to_dict()
 
+@router.get("/submissions/{submission_id}/text")
+async def get_submission_text(
+    submission_id: str,
+    offset: int = 0,
+    length: Optional[int] = None,
+    job_service: JobService = Depends(get_job_service)
+):
+    result = await job_service.get_submission_text(submission_id, offset, length)
+    return {"submission_id": submission_id, **result.to_dict()}
+
 @router.post("/release/{job_id}")
 async def release_job(job_id: str, job_service: JobService = Depends(get_job_service)):
     result = await job_service.release_job(job_id)
@@ -354,6 +604,18 @@ async def get_available_jobs(
     jobs = await job_service.get_available_jobs(limit, offset, complexity)
     return {"jobs": jobs, "count": len(jobs)}
 
+@router.get("/search")
+async def search_jobs(
+    q: str,
+    status: Optional[str] = "available",
+    complexity: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    job_service: JobService = Depends(get_job_service)
+):
+    jobs = await job_service.search_jobs(q, status, complexity, limit, offset)
+    return {"jobs": jobs, "count": len(jobs)}
+
 @router.get("/my-jobs")
 async def get_my_jobs(
     user_id: str = Depends(get_current_user_id),
@@ -0,0 +1,230 @@
+"""
+Content Localization & AI Tutorial Platform
+Reporting Service - Dashboard Rollups
+
+Serves dashboard aggregates from the incrementally maintained rollup
+tables and rebuilds them from job history when needed.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional, List
+
+
+@dataclass
+class DashboardStats:
+    """Aggregates for the admin (all jobs) or manager (own jobs) dashboard."""
+    manager_id: Optional[str] = None
+    status_counts: dict = field(default_factory=dict)
+    pending_review: int = 0
+
+    # Throughput
+    locks_count: int = 0
+    submits_count: int = 0
+    avg_lock_to_submit_seconds: Optional[int] = None
+    timeouts_count: int = 0
+    releases_count: int = 0
+    timeout_rate: float = 0.0
+
+    # Payouts
+    paid_jobs_count: int = 0
+    total_payout: Decimal = Decimal("0")
+
+    backfill_in_progress: bool = False
+
+    @property
+    def total_jobs(self) -> int:
+        return sum(self.status_counts.values())
+
+    @classmethod
+    def from_rpc(cls, data: dict) -> "DashboardStats":
+        return cls(
+            manager_id=data.get('manager_id'),
+            status_counts={status: int(count) for status, count in (data.get('status_counts') or {}).items()},
+            pending_review=int(data.get('pending_review') or 0),
+            locks_count=int(data.get('locks_count') or 0),
+            submits_count=int(data.get('submits_count') or 0),
+            avg_lock_to_submit_seconds=(
+                int(data['avg_lock_to_submit_seconds'])
+                if data.get('avg_lock_to_submit_seconds') is not None else None
+            ),
+            timeouts_count=int(data.get('timeouts_count') or 0),
+            releases_count=int(data.get('releases_count') or 0),
+            timeout_rate=float(data.get('timeout_rate') or 0),
+            paid_jobs_count=int(data.get('paid_jobs_count') or 0),
+            total_payout=Decimal(str(data.get('total_payout') or 0)),
+            backfill_in_progress=bool(data.get('backfill_in_progress')),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "manager_id": self.manager_id,
+            "status_counts": self.status_counts,
+            "total_jobs": self.total_jobs,
+            "pending_review": self.pending_review,
+            "locks_count": self.locks_count,
+            "submits_count": self.submits_count,
+            "avg_lock_to_submit_seconds": self.avg_lock_to_submit_seconds,
+            "timeouts_count": self.timeouts_count,
+            "releases_count": self.releases_count,
+            "timeout_rate": self.timeout_rate,
+            "paid_jobs_count": self.paid_jobs_count,
+            "total_payout": str(self.total_payout),
+            "backfill_in_progress": self.backfill_in_progress,
+        }
+
+
+@dataclass
+class CtvEarnings:
+    """Payout totals for one CTV."""
+    user_id: str
+    full_name: Optional[str]
+    paid_jobs_count: int
+    total_payout: Decimal
+
+    def to_dict(self) -> dict:
+        return {
+            "user_id": str(self.user_id),
+            "full_name": self.full_name,
+            "paid_jobs_count": self.paid_jobs_count,
+            "total_payout": str(self.total_payout),
+        }
+
+
+class ReportingService:
+    """
+    Service layer for dashboard reporting.
+
+    Reads come from rollup tables fed by the `apply_job_rollups` trigger,
+    plus the deltas not yet merged by the `job-rollups-merge` cron job, so
+    their cost does not grow with the number of jobs.
+    """
+
+    def __init__(self, supabase_client):
+        """
+        Initialize reporting service.
+
+        Args:
+            supabase_client: Configured Supabase client instance.
+        """
+        self.client = supabase_client
+
+    async def get_dashboard_stats(self, manager_id: Optional[str] = None) -> DashboardStats:
+        """
+        Get dashboard aggregates.
+
+        Admins get totals across all jobs, or for one manager when
+        `manager_id` is given. Managers always get their own jobs.
+
+        Args:
+            manager_id: Optional UUID of the manager to scope the stats to.
+
+        Returns:
+            DashboardStats for the requested scope.
+
+        Raises:
+            Exception: If the caller is not a manager or admin.
+        """
+        response = await self.client.rpc('get_dashboard_rollups', {
+            'p_manager_id': manager_id,
+        }).execute()
+        result = response.data
+
+        if not result.get('success'):
+            raise Exception(result.get('message', 'Failed to load dashboard stats'))
+
+        return DashboardStats.from_rpc(result)
+
+    async def get_ctv_earnings(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[CtvEarnings]:
+        """
+        Get payout totals per CTV, highest first.
+
+        CTVs only ever receive their own row.
+
+        Args:
+            user_id: Optional UUID of a single CTV.
+            limit: Maximum number of CTVs to return.
+            offset: Offset for pagination.
+
+        Returns:
+            List of CtvEarnings.
+        """
+        response = await self.client.rpc('get_ctv_earnings', {
+            'p_user_id': user_id,
+            'p_limit': limit,
+            'p_offset': offset,
+        }).execute()
+        result = response.data
+
+        if not result.get('success'):
+            raise Exception(result.get('message', 'Failed to load CTV earnings'))
+
+        return [
+            CtvEarnings(
+                user_id=row['user_id'],
+                full_name=row.get('full_name'),
+                paid_jobs_count=int(row.get('paid_jobs_count') or 0),
+                total_payout=Decimal(str(row.get('total_payout') or 0)),
+            )
+            for row in result.get('earnings', [])
+        ]
+
+    async def backfill_rollups(self, batch_size: int = 1000) -> int:
+        """
+        Rebuild all rollups from job state and job history.
+
+        Requires a service-role client. Each batch runs in its own
+        transaction, and live status changes keep being applied for jobs
+        the backfill has already passed.
+
+        Args:
+            batch_size: Number of jobs folded in per database call.
+
+        Returns:
+            Total number of jobs processed.
+        """
+        response = await self.client.rpc('start_job_rollups_backfill', {}).execute()
+        if not response.data.get('success'):
+            raise Exception(response.data.get('message', 'Failed to start backfill'))
+
+        processed = 0
+        while True:
+            response = await self.client.rpc('backfill_job_rollups_batch', {
+                'p_batch_size': batch_size,
+            }).execute()
+            result = response.data
+
+            if not result.get('success'):
+                raise Exception(result.get('message', 'Backfill batch failed'))
+
+            processed += result.get('processed', 0)
+            if result.get('done'):
+                return processed
+
+
+# Backfill command
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import os
+
+    from supabase import acreate_client
+
+    parser = argparse.ArgumentParser(description="Rebuild dashboard rollups from job history.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    async def main():
+        client = await acreate_client(
+            os.environ["SUPABASE_URL"],
+            os.environ["SUPABASE_SERVICE_ROLE_KEY"],
+        )
+        processed = await ReportingService(client).backfill_rollups(args.batch_size)
+        print(f"Rebuilt rollups from {processed} jobs")
+
+    asyncio.run(main())
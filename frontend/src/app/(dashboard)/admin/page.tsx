@@ -4,6 +4,7 @@ export const dynamic = 'force-dynamic'
 
 import { redirect } from 'next/navigation'
 import Link from 'next/link'
+import type { DashboardRollups } from '@/types/database'
 import {
     Users,
     Briefcase,
@@ -45,29 +46,22 @@ export default async function AdminDashboard() {
         .select('*', { count: 'exact', head: true })
         .eq('role', 'ctv')
 
-    const { count: totalJobs } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-
-    const { count: completedJobs } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-        .eq('status', 'completed')
+    // Job totals come from incrementally maintained rollups
+    const { data: rollupData } = await supabase.rpc('get_dashboard_rollups')
+    const rollups = (rollupData || {}) as DashboardRollups
+    const statusCounts = rollups.status_counts || {}
 
-    const { count: pendingJobs } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-        .in('status', ['available', 'locked', 'submitted'])
+    const totalJobs = Object.values(statusCounts).reduce((sum, count) => sum + (count || 0), 0)
+    const completedJobs = statusCounts.completed || 0
+    const pendingJobs = (statusCounts.available || 0) + (statusCounts.locked || 0) + (statusCounts.submitted || 0)
 
-    // Get total payouts (sum of approved jobs)
-    const { data: approvedJobs } = await supabase
-        .from('jobs')
-        .select('pricing_data')
-        .eq('status', 'approved')
+    // Total payouts (approved and completed jobs)
+    const totalPayouts = Number(rollups.total_payout || 0)
 
-    const totalPayouts = approvedJobs?.reduce((sum, job) =>
-        sum + (job.pricing_data?.final_price || 0), 0
-    ) || 0
+    const avgLockToSubmitHours = rollups.avg_lock_to_submit_seconds
+        ? (rollups.avg_lock_to_submit_seconds / 3600).toFixed(1)
+        : null
+    const timeoutRate = Math.round((rollups.timeout_rate || 0) * 100)
 
     return (
         <div className="p-8">
@@ -169,6 +163,22 @@ export default async function AdminDashboard() {
                 </div>
             </div>
 
+            {/* Throughput Stats */}
+            <div className="grid grid-cols-1 md:grid-cols-2 gap-6 mb-8">
+                <div className="bg-white rounded-xl p-6 shadow-sm border">
+                    <p className="text-sm text-gray-500">Thời gian TB từ nhận đến nộp</p>
+                    <p className="text-2xl font-bold">{avgLockToSubmitHours ? `${avgLockToSubmitHours} giờ` : '—'}</p>
+                </div>
+
+                <div className="bg-white rounded-xl p-6 shadow-sm border">
+                    <p className="text-sm text-gray-500">Tỷ lệ quá hạn</p>
+                    <p className="text-2xl font-bold text-red-600">{timeoutRate}%</p>
+                    <p className="text-xs text-gray-400 mt-1">
+                        {rollups.timeouts_count || 0} / {rollups.locks_count || 0} lượt nhận việc
+                    </p>
+                </div>
+            </div>
+
             {/* Quick Actions */}
             <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
                 <Link
@@ -3,6 +3,7 @@ import { createClient } from '@/lib/supabase/server'
 export const dynamic = 'force-dynamic'
 import { redirect } from 'next/navigation'
 import Link from 'next/link'
+import type { DashboardRollups } from '@/types/database'
 import { Briefcase, FileCheck, Clock, CheckCircle2, AlertCircle } from 'lucide-react'
 
 export default async function ManagerDashboard() {
@@ -26,27 +27,15 @@ export default async function ManagerDashboard() {
     }
 
     // Get stats
-    const { count: totalJobs } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-        .eq('created_by', user.id)
-
-    const { count: pendingReview } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-        .eq('status', 'submitted')
-
-    const { count: activeJobs } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-        .eq('created_by', user.id)
-        .in('status', ['available', 'locked'])
-
-    const { count: completedJobs } = await supabase
-        .from('jobs')
-        .select('*', { count: 'exact', head: true })
-        .eq('created_by', user.id)
-        .eq('status', 'completed')
+    // Stats come from incrementally maintained rollups (scoped to own jobs)
+    const { data: rollupData } = await supabase.rpc('get_dashboard_rollups')
+    const rollups = (rollupData || {}) as DashboardRollups
+    const statusCounts = rollups.status_counts || {}
+
+    const totalJobs = Object.values(statusCounts).reduce((sum, count) => sum + (count || 0), 0)
+    const pendingReview = rollups.pending_review || 0
+    const activeJobs = (statusCounts.available || 0) + (statusCounts.locked || 0)
+    const completedJobs = statusCounts.completed || 0
 
     return (
         <div className="p-8">
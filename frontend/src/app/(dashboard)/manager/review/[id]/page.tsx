@@ -5,6 +5,7 @@ import { redirect, notFound } from 'next/navigation'
 import Link from 'next/link'
 import { ArrowLeft, User, Clock, FileText, Video, ExternalLink } from 'lucide-react'
 import { ReviewForm } from '@/components/forms/review-form'
+import { SubmissionText } from '@/components/forms/submission-text'
 import { Badge } from '@/components/ui/badge'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { formatCurrency, formatDate, getComplexityColor } from '@/lib/utils'
@@ -37,10 +38,10 @@ export default async function ReviewJobPage({ params }: ReviewJobPageProps) {
         notFound()
     }
 
-    // Get latest submission
+    // Get latest submission (translated text is loaded on demand)
     const { data: submission } = await supabase
         .from('submissions')
-        .select('*')
+        .select('id, job_id, user_id, content_id, video_url, notes, revision_number, created_at')
         .eq('job_id', id)
         .order('created_at', { ascending: false })
         .limit(1)
@@ -152,6 +153,9 @@ export default async function ReviewJobPage({ params }: ReviewJobPageProps) {
                                     Xem video nộp
                                 </a>
                             )}
+                            <div className="pt-2 border-t">
+                                <SubmissionText submissionId={submission.id} />
+                            </div>
                             {submission.notes && (
                                 <div className="pt-2 border-t">
                                     <p className="text-gray-500 mb-1">Ghi chú:</p>
@@ -0,0 +1,72 @@
+'use client'
+
+import { useState } from 'react'
+import { FileText } from 'lucide-react'
+import { createClient } from '@/lib/supabase/client'
+import { Button } from '@/components/ui/button'
+import type { SubmissionContentResult } from '@/types/database'
+
+// Characters fetched per request; long translations are paged in
+const PAGE_SIZE = 20000
+
+interface SubmissionTextProps {
+    submissionId: string
+}
+
+export function SubmissionText({ submissionId }: SubmissionTextProps) {
+    const [text, setText] = useState<string | null>(null)
+    const [totalLength, setTotalLength] = useState(0)
+    const [loading, setLoading] = useState(false)
+    const supabase = createClient()
+
+    const loadMore = async () => {
+        setLoading(true)
+        try {
+            const offset = text?.length ?? 0
+            const { data, error } = await supabase.rpc('get_submission_content', {
+                p_submission_id: submissionId,
+                p_offset: offset,
+                p_length: PAGE_SIZE,
+            })
+            if (error) throw error
+
+            const result = data as SubmissionContentResult
+            if (!result.success) throw new Error(result.message)
+
+            setText((text ?? '') + (result.text ?? ''))
+            setTotalLength(result.total_length ?? 0)
+        } catch (error) {
+            console.error('Load submission text error:', error)
+            alert('Không tải được bản dịch')
+        } finally {
+            setLoading(false)
+        }
+    }
+
+    if (text === null) {
+        return (
+            <Button variant="outline" size="sm" loading={loading} onClick={loadMore}>
+                <FileText className="h-4 w-4" />
+                Xem bản dịch
+            </Button>
+        )
+    }
+
+    if (totalLength === 0) {
+        return <p className="text-gray-500">Không có bản dịch</p>
+    }
+
+    return (
+        <div className="space-y-2">
+            <p className="text-gray-500">Bản dịch:</p>
+            <div className="max-h-96 overflow-y-auto whitespace-pre-wrap text-gray-700 bg-gray-50 p-2 rounded">
+                {text}
+            </div>
+            {text.length < totalLength && (
+                <Button variant="ghost" size="sm" loading={loading} onClick={loadMore}>
+                    Tải thêm ({text.length.toLocaleString()}/{totalLength.toLocaleString()})
+                </Button>
+            )}
+        </div>
+    )
+}
@@ -83,6 +83,7 @@ export interface Submission {
     job_id: string
     user_id: string
     translated_text: string | null
+    content_id: string | null
     video_url: string | null
     thumbnail_url: string | null
     additional_files: string[]
@@ -125,6 +126,33 @@ export interface SubmitJobResult {
     submission_id?: string
 }
 
+export interface SubmissionContentResult {
+    success: boolean
+    message?: string
+    error?: string
+    text?: string | null
+    offset?: number
+    total_length?: number
+}
+
+export interface DashboardRollups {
+    success: boolean
+    message?: string
+    error?: string
+    manager_id?: string | null
+    status_counts?: Partial<Record<JobStatus, number>>
+    pending_review?: number
+    locks_count?: number
+    submits_count?: number
+    avg_lock_to_submit_seconds?: number | null
+    timeouts_count?: number
+    releases_count?: number
+    timeout_rate?: number
+    paid_jobs_count?: number
+    total_payout?: number
+    backfill_in_progress?: boolean
+}
+
 // Form types
 export interface SafetyChecks {
     is_political_safe: boolean
@@ -0,0 +1,136 @@
+-- =====================================================
+-- Content Localization & AI Tutorial Platform
+-- Benchmark: search_jobs() at 100k+ jobs
+-- =====================================================
+
+-- Seeds 120,000 synthetic jobs, times typical searches, then rolls
+-- everything back. Run after 008_job_search.sql with psql as the
+-- postgres user:
+--
+--   psql "$DATABASE_URL" -f supabase/benchmarks/search_jobs_benchmark.sql
+--
+-- search_jobs() is plpgsql, so EXPLAIN on a call only shows a Function
+-- Scan. Each case is therefore run twice: EXPLAIN ANALYZE on a prepared
+-- statement holding the query the function runs for it (full-text, the
+-- trigram fallback when full-text finds nothing, or the empty-query
+-- listing), to see the index plan, and the function call itself with
+-- \timing, for end-to-end latency.
+--
+-- Recorded on PostgreSQL 18.6 (local, default settings, 120,000 jobs),
+-- execution time of the inner query / \timing of the function call:
+--
+--   'ComfyUI', available                   87.5 ms /  71.0 ms   (10,000 ranked)
+--   'Stable Diffusion', available, medium  36.9 ms /  30.3 ms   ( 5,000 ranked)
+--   'comfy' (trigram fallback)            176.5 ms / 177.1 ms   (10,000 ranked)
+--   'stable difusion' (trigram fallback)  152.5 ms / 175.5 ms   ( 5,000 ranked)
+--   'workflow', any status, page 101       89.2 ms /  49.8 ms   (24,000 ranked)
+--   'nonexistent tool'                      0.4 ms +  3.8 ms /  5.6 ms
+--   '' (listing), available                 0.2 ms /   0.4 ms
+--   '' (listing), any status, page 101      2.1 ms /   2.3 ms
+--
+-- No plan scans jobs sequentially. Filtered searches BitmapAnd the search
+-- index with idx_jobs_status_complexity; the rest use the search index
+-- alone. The listing walks idx_jobs_created_at (or
+-- idx_jobs_status_created_at for rarer statuses) and stops after the page.
+-- Search cost grows with the number of matches, since every match is
+-- ranked before the page is cut; trigram ranking (word_similarity) costs
+-- roughly twice as much per row as ts_rank_cd.
+
+\timing on
+
+BEGIN;
+
+-- Skip FK checks and triggers (including rollups) for the synthetic rows
+SET LOCAL session_replication_role = replica;
+
+INSERT INTO jobs (title, description, word_count, complexity, ai_metadata, status, created_by)
+SELECT
+    format('%s tutorial #%s', tool, n),
+    format('Hướng dẫn %s cho %s, bài số %s', tool, topic, n),
+    (random() * 5000)::INTEGER,
+    (ARRAY['easy', 'medium', 'hard', 'expert'])[1 + n % 4]::complexity_level,
+    jsonb_build_object(
+        'ai_tools_used', jsonb_build_array(tool, second_tool),
+        'tutorial_type', topic,
+        'model_links', jsonb_build_array(format('https://civitai.com/models/%s', n))
+    ),
+    (ARRAY['available', 'available', 'available', 'locked', 'submitted', 'completed'])[1 + n % 6]::job_status,
+    uuid_generate_v4()
+FROM (
+    SELECT
+        n,
+        (ARRAY['ComfyUI', 'Stable Diffusion', 'Midjourney', 'Flux', 'Runway', 'Kling', 'Suno', 'ElevenLabs'])[1 + n % 8] AS tool,
+        (ARRAY['LoRA', 'ControlNet', 'Whisper', 'AnimateDiff'])[1 + n % 4] AS second_tool,
+        (ARRAY['workflow', 'training', 'video', 'voice', 'upscale'])[1 + n % 5] AS topic
+    FROM generate_series(1, 120000) AS n
+) seed;
+
+ANALYZE jobs;
+
+SELECT COUNT(*) AS seeded_jobs FROM jobs;
+
+-- The two ranked queries from search_jobs(): $1 query, $2 status,
+-- $3 complexity, $4 limit, $5 offset
+PREPARE search_fts(TEXT, job_status, complexity_level, INTEGER, INTEGER) AS
+SELECT j.id, ts_rank_cd(j.search_vector, websearch_to_tsquery('simple', lower(btrim($1))))::REAL AS rank
+FROM jobs j
+WHERE j.search_vector @@ websearch_to_tsquery('simple', lower(btrim($1)))
+AND ($2 IS NULL OR j.status = $2)
+AND ($3 IS NULL OR j.complexity = $3)
+ORDER BY rank DESC, j.created_at DESC, j.id
+LIMIT $4 OFFSET $5;
+
+PREPARE search_trgm(TEXT, job_status, complexity_level, INTEGER, INTEGER) AS
+SELECT j.id, word_similarity(lower(btrim($1)), job_search_text(j.title, j.ai_metadata))::REAL AS rank
+FROM jobs j
+WHERE lower(btrim($1)) <% job_search_text(j.title, j.ai_metadata)
+AND ($2 IS NULL OR j.status = $2)
+AND ($3 IS NULL OR j.complexity = $3)
+ORDER BY rank DESC, j.created_at DESC, j.id
+LIMIT $4 OFFSET $5;
+
+-- The empty-query listing from search_jobs()
+PREPARE search_list(job_status, complexity_level, INTEGER, INTEGER) AS
+SELECT j.id
+FROM jobs j
+WHERE ($1 IS NULL OR j.status = $1)
+AND ($2 IS NULL OR j.complexity = $2)
+ORDER BY j.created_at DESC, j.id
+LIMIT $3 OFFSET $4;
+
+-- Exact tool name
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_fts('ComfyUI', 'available', NULL, 20, 0);
+SELECT COUNT(*) FROM search_jobs('ComfyUI');
+
+-- Multi-word phrase with complexity filter
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_fts('Stable Diffusion', 'available', 'medium', 20, 0);
+SELECT COUNT(*) FROM search_jobs('Stable Diffusion', 'available', 'medium');
+
+-- Partial word and typo (no full-text match, trigram fallback)
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_trgm('comfy', 'available', NULL, 20, 0);
+SELECT COUNT(*) FROM search_jobs('comfy');
+
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_trgm('stable difusion', 'available', NULL, 20, 0);
+SELECT COUNT(*) FROM search_jobs('stable difusion');
+
+-- Broad term, any status, deep page
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_fts('workflow', NULL, NULL, 20, 2000);
+SELECT COUNT(*) FROM search_jobs('workflow', NULL, NULL, 20, 2000);
+
+-- No matches (both queries run)
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_fts('nonexistent tool', 'available', NULL, 20, 0);
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_trgm('nonexistent tool', 'available', NULL, 20, 0);
+SELECT COUNT(*) FROM search_jobs('nonexistent tool');
+
+-- Empty query: newest available jobs, and any status on a deep page
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_list('available', NULL, 20, 0);
+SELECT COUNT(*) FROM search_jobs('', 'available');
+
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE search_list(NULL, NULL, 20, 2000);
+SELECT COUNT(*) FROM search_jobs('', NULL, NULL, 20, 2000);
+
+DEALLOCATE search_list;
+DEALLOCATE search_fts;
+DEALLOCATE search_trgm;
+
+ROLLBACK;
@@ -0,0 +1,611 @@
+-- =====================================================
+-- Content Localization & AI Tutorial Platform
+-- Phase 2: Chunked, Compressed Submission Content
+-- =====================================================
+
+-- Translated text is stored once per (job, content hash) in a compressed
+-- column and submission rows only reference it, so resubmitting unchanged
+-- text after a rejection costs no extra storage. Short texts still go
+-- through a single submit_job() call; long ones are streamed in bounded
+-- chunks (begin_submission_upload / append_submission_chunk /
+-- submit_job_content) of at most 65,536 characters, 256 per upload, and
+-- skip the upload entirely when the hash is already stored.
+-- submissions.translated_text is only kept for legacy rows.
+
+-- =====================================================
+-- SUBMISSION CONTENTS TABLE
+-- Deduplicated translated text, compressed at rest
+-- =====================================================
+
+CREATE TABLE submission_contents (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+
+    job_id UUID NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+
+    -- SHA-256 (hex) of the UTF-8 encoded text
+    content_hash TEXT NOT NULL CHECK (content_hash ~ '^[0-9a-f]{64}$'),
+
+    -- Size of the UTF-8 encoded text, for display without loading the body
+    byte_size INTEGER NOT NULL DEFAULT 0,
+
+    -- lz4-compressed once large enough to be TOASTed (about 2 kB);
+    -- shorter texts stay inline and uncompressed
+    body TEXT NOT NULL,
+
+    created_by UUID NOT NULL REFERENCES profiles(id),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    UNIQUE (job_id, content_hash)
+);
+
+ALTER TABLE submission_contents ALTER COLUMN body SET COMPRESSION lz4;
+
+-- Submissions reference content instead of storing it inline
+ALTER TABLE submissions ADD COLUMN IF NOT EXISTS content_id UUID REFERENCES submission_contents(id);
+
+CREATE INDEX idx_submissions_content_id ON submissions(content_id);
+
+-- =====================================================
+-- SUBMISSION UPLOADS TABLES
+-- Staging area for chunked uploads, cleared on finalize
+-- =====================================================
+
+CREATE TABLE submission_uploads (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+
+    job_id UUID NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    user_id UUID NOT NULL REFERENCES profiles(id),
+
+    -- Optional hash announced up front (used for early deduplication)
+    content_hash TEXT CHECK (content_hash ~ '^[0-9a-f]{64}$'),
+
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_submission_uploads_created_at ON submission_uploads(created_at);
+
+CREATE TABLE submission_upload_chunks (
+    upload_id UUID NOT NULL REFERENCES submission_uploads(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL CHECK (chunk_index >= 0),
+    data TEXT NOT NULL,
+
+    PRIMARY KEY (upload_id, chunk_index)
+);
+
+-- Only reachable through the SECURITY DEFINER functions below
+ALTER TABLE submission_contents ENABLE ROW LEVEL SECURITY;
+ALTER TABLE submission_uploads ENABLE ROW LEVEL SECURITY;
+ALTER TABLE submission_upload_chunks ENABLE ROW LEVEL SECURITY;
+
+-- =====================================================
+-- HELPER FUNCTION: Check caller may submit for a job
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION check_submission_access(p_job_id UUID, p_user_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    v_job_locked_by UUID;
+    v_job_status job_status;
+BEGIN
+    IF p_user_id IS NULL THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'NOT_AUTHENTICATED',
+            'message', 'User must be authenticated'
+        );
+    END IF;
+
+    SELECT locked_by, status INTO v_job_locked_by, v_job_status
+    FROM jobs
+    WHERE id = p_job_id;
+
+    IF v_job_locked_by IS NULL OR v_job_locked_by != p_user_id THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'NOT_JOB_OWNER',
+            'message', 'You do not own this job'
+        );
+    END IF;
+
+    IF v_job_status NOT IN ('locked', 'rejected') THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'INVALID_STATUS',
+            'message', 'Job cannot be submitted in current status'
+        );
+    END IF;
+
+    RETURN jsonb_build_object('success', TRUE);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- HELPER FUNCTION: Store submission text (deduplicated)
+-- Returns the id of the content row for this job and text
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION store_submission_content(
+    p_job_id UUID,
+    p_user_id UUID,
+    p_body TEXT
+)
+RETURNS UUID AS $$
+DECLARE
+    v_hash TEXT;
+    v_content_id UUID;
+BEGIN
+    v_hash := encode(sha256(convert_to(p_body, 'UTF8')), 'hex');
+
+    INSERT INTO submission_contents (job_id, content_hash, byte_size, body, created_by)
+    VALUES (p_job_id, v_hash, octet_length(p_body), p_body, p_user_id)
+    ON CONFLICT (job_id, content_hash) DO NOTHING
+    RETURNING id INTO v_content_id;
+
+    -- Same text submitted before for this job
+    IF v_content_id IS NULL THEN
+        SELECT id INTO v_content_id
+        FROM submission_contents
+        WHERE job_id = p_job_id
+        AND content_hash = v_hash;
+    END IF;
+
+    RETURN v_content_id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- HELPER FUNCTION: Create a submission row
+-- Links resubmissions to the previous attempt; shared by
+-- submit_job and submit_job_content
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION create_submission(
+    p_job_id UUID,
+    p_user_id UUID,
+    p_content_id UUID,
+    p_video_url TEXT,
+    p_notes TEXT
+)
+RETURNS UUID AS $$
+DECLARE
+    v_parent_id UUID;
+    v_revision INTEGER;
+    v_submission_id UUID;
+BEGIN
+    SELECT id, revision_number + 1 INTO v_parent_id, v_revision
+    FROM submissions
+    WHERE job_id = p_job_id
+    ORDER BY created_at DESC
+    LIMIT 1;
+
+    INSERT INTO submissions (
+        job_id, user_id, content_id, video_url, notes,
+        revision_number, parent_submission_id
+    )
+    VALUES (
+        p_job_id, p_user_id, p_content_id, p_video_url, p_notes,
+        COALESCE(v_revision, 1), v_parent_id
+    )
+    RETURNING id INTO v_submission_id;
+
+    RETURN v_submission_id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: submit_job (replaces 003)
+-- Single-call submission; text goes to submission_contents
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION submit_job(
+    p_job_id UUID,
+    p_translated_text TEXT DEFAULT NULL,
+    p_video_url TEXT DEFAULT NULL,
+    p_notes TEXT DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_user_id UUID;
+    v_access JSONB;
+    v_job_status job_status;
+    v_content_id UUID;
+    v_submission_id UUID;
+BEGIN
+    v_user_id := auth.uid();
+
+    -- Lock the job row before checking ownership and status
+    SELECT status INTO v_job_status
+    FROM jobs
+    WHERE id = p_job_id
+    FOR UPDATE;
+
+    v_access := check_submission_access(p_job_id, v_user_id);
+    IF NOT (v_access->>'success')::BOOLEAN THEN
+        RETURN v_access;
+    END IF;
+
+    IF p_translated_text IS NOT NULL THEN
+        v_content_id := store_submission_content(p_job_id, v_user_id, p_translated_text);
+    END IF;
+
+    -- Create submission
+    v_submission_id := create_submission(p_job_id, v_user_id, v_content_id, p_video_url, p_notes);
+
+    -- Update job status
+    UPDATE jobs
+    SET
+        status = 'submitted',
+        updated_at = NOW()
+    WHERE id = p_job_id;
+
+    -- Record in history
+    INSERT INTO job_history (job_id, previous_status, new_status, changed_by, change_reason)
+    VALUES (p_job_id, v_job_status, 'submitted', v_user_id, 'CTV submitted work for review');
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'message', 'Job submitted successfully',
+        'submission_id', v_submission_id,
+        'content_id', v_content_id
+    );
+
+EXCEPTION
+    WHEN OTHERS THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'SYSTEM_ERROR',
+            'message', SQLERRM
+        );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: begin_submission_upload
+-- Opens a chunked upload. If the announced hash is already
+-- stored for this job, returns the existing content instead.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION begin_submission_upload(
+    p_job_id UUID,
+    p_content_hash TEXT DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_user_id UUID;
+    v_access JSONB;
+    v_content_id UUID;
+    v_upload_id UUID;
+BEGIN
+    v_user_id := auth.uid();
+
+    v_access := check_submission_access(p_job_id, v_user_id);
+    IF NOT (v_access->>'success')::BOOLEAN THEN
+        RETURN v_access;
+    END IF;
+
+    IF p_content_hash IS NOT NULL THEN
+        SELECT id INTO v_content_id
+        FROM submission_contents
+        WHERE job_id = p_job_id
+        AND content_hash = p_content_hash;
+
+        IF v_content_id IS NOT NULL THEN
+            RETURN jsonb_build_object(
+                'success', TRUE,
+                'message', 'Content already stored',
+                'content_id', v_content_id,
+                'deduplicated', TRUE
+            );
+        END IF;
+    END IF;
+
+    INSERT INTO submission_uploads (job_id, user_id, content_hash)
+    VALUES (p_job_id, v_user_id, p_content_hash)
+    RETURNING id INTO v_upload_id;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'message', 'Upload started',
+        'upload_id', v_upload_id,
+        'deduplicated', FALSE
+    );
+
+EXCEPTION
+    WHEN OTHERS THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'SYSTEM_ERROR',
+            'message', SQLERRM
+        );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: append_submission_chunk
+-- Stores one chunk of an open upload (idempotent per index).
+-- Chunks hold at most 65,536 characters and indexes run
+-- 0-255, which caps an upload at 16M characters.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION append_submission_chunk(
+    p_upload_id UUID,
+    p_chunk_index INTEGER,
+    p_data TEXT
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_user_id UUID;
+    v_job_id UUID;
+    v_access JSONB;
+BEGIN
+    v_user_id := auth.uid();
+
+    SELECT job_id INTO v_job_id
+    FROM submission_uploads
+    WHERE id = p_upload_id
+    AND user_id = v_user_id;
+
+    IF v_job_id IS NULL THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'UPLOAD_NOT_FOUND',
+            'message', 'Upload not found'
+        );
+    END IF;
+
+    -- The job may have timed out or been released since the upload began
+    v_access := check_submission_access(v_job_id, v_user_id);
+    IF NOT (v_access->>'success')::BOOLEAN THEN
+        RETURN v_access;
+    END IF;
+
+    IF length(p_data) > 65536 THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'CHUNK_TOO_LARGE',
+            'message', 'Chunks may hold at most 65536 characters'
+        );
+    END IF;
+
+    IF p_chunk_index >= 256 THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'TOO_MANY_CHUNKS',
+            'message', 'Uploads may have at most 256 chunks'
+        );
+    END IF;
+
+    -- Retried chunks overwrite the previous attempt
+    INSERT INTO submission_upload_chunks (upload_id, chunk_index, data)
+    VALUES (p_upload_id, p_chunk_index, p_data)
+    ON CONFLICT (upload_id, chunk_index) DO UPDATE SET data = EXCLUDED.data;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'message', 'Chunk stored',
+        'chunk_index', p_chunk_index
+    );
+
+EXCEPTION
+    WHEN OTHERS THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'SYSTEM_ERROR',
+            'message', SQLERRM
+        );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: submit_job_content
+-- Finalizes a submission from an upload or stored content
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION submit_job_content(
+    p_job_id UUID,
+    p_content_hash TEXT,
+    p_upload_id UUID DEFAULT NULL,
+    p_content_id UUID DEFAULT NULL,
+    p_chunk_count INTEGER DEFAULT NULL,
+    p_video_url TEXT DEFAULT NULL,
+    p_notes TEXT DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_user_id UUID;
+    v_access JSONB;
+    v_job_status job_status;
+    v_content_id UUID;
+    v_body TEXT;
+    v_stored_chunks INTEGER;
+    v_submission_id UUID;
+BEGIN
+    v_user_id := auth.uid();
+
+    -- Lock the job row before re-checking ownership and status
+    SELECT status INTO v_job_status
+    FROM jobs
+    WHERE id = p_job_id
+    FOR UPDATE;
+
+    v_access := check_submission_access(p_job_id, v_user_id);
+    IF NOT (v_access->>'success')::BOOLEAN THEN
+        RETURN v_access;
+    END IF;
+
+    IF p_content_id IS NOT NULL THEN
+        -- Deduplicated path: content already stored for this job
+        SELECT id INTO v_content_id
+        FROM submission_contents
+        WHERE id = p_content_id
+        AND job_id = p_job_id
+        AND content_hash = p_content_hash;
+    ELSE
+        IF NOT EXISTS (
+            SELECT 1 FROM submission_uploads
+            WHERE id = p_upload_id
+            AND job_id = p_job_id
+            AND user_id = v_user_id
+        ) THEN
+            RETURN jsonb_build_object(
+                'success', FALSE,
+                'error', 'UPLOAD_NOT_FOUND',
+                'message', 'Upload not found'
+            );
+        END IF;
+
+        SELECT COUNT(*), string_agg(data, '' ORDER BY chunk_index)
+        INTO v_stored_chunks, v_body
+        FROM submission_upload_chunks
+        WHERE upload_id = p_upload_id;
+
+        IF p_chunk_count IS NOT NULL AND v_stored_chunks != p_chunk_count THEN
+            RETURN jsonb_build_object(
+                'success', FALSE,
+                'error', 'UPLOAD_INCOMPLETE',
+                'message', format('Expected %s chunks, received %s', p_chunk_count, v_stored_chunks)
+            );
+        END IF;
+
+        v_body := COALESCE(v_body, '');
+
+        IF encode(sha256(convert_to(v_body, 'UTF8')), 'hex') != p_content_hash THEN
+            RETURN jsonb_build_object(
+                'success', FALSE,
+                'error', 'HASH_MISMATCH',
+                'message', 'Uploaded content does not match the declared hash'
+            );
+        END IF;
+
+        v_content_id := store_submission_content(p_job_id, v_user_id, v_body);
+
+        DELETE FROM submission_uploads WHERE id = p_upload_id;
+    END IF;
+
+    IF v_content_id IS NULL THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'CONTENT_NOT_FOUND',
+            'message', 'Submission content not found'
+        );
+    END IF;
+
+    v_submission_id := create_submission(p_job_id, v_user_id, v_content_id, p_video_url, p_notes);
+
+    UPDATE jobs
+    SET
+        status = 'submitted',
+        updated_at = NOW()
+    WHERE id = p_job_id;
+
+    INSERT INTO job_history (job_id, previous_status, new_status, changed_by, change_reason)
+    VALUES (p_job_id, v_job_status, 'submitted', v_user_id, 'CTV submitted work for review');
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'message', 'Job submitted successfully',
+        'submission_id', v_submission_id,
+        'content_id', v_content_id
+    );
+
+EXCEPTION
+    WHEN OTHERS THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'SYSTEM_ERROR',
+            'message', SQLERRM
+        );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: get_submission_content
+-- Lazily loads submission text for reviewers and the author
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION get_submission_content(
+    p_submission_id UUID,
+    p_offset INTEGER DEFAULT 0,
+    p_length INTEGER DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_user_id UUID;
+    v_submission RECORD;
+    v_body TEXT;
+    v_total INTEGER;
+BEGIN
+    v_user_id := auth.uid();
+
+    SELECT s.user_id, s.content_id, s.translated_text, j.created_by
+    INTO v_submission
+    FROM submissions s
+    JOIN jobs j ON j.id = s.job_id
+    WHERE s.id = p_submission_id;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'SUBMISSION_NOT_FOUND',
+            'message', 'Submission not found'
+        );
+    END IF;
+
+    -- Mirrors the SELECT policies on submissions
+    IF NOT (
+        v_submission.user_id = v_user_id
+        OR (get_user_role() = 'manager' AND v_submission.created_by = v_user_id)
+        OR get_user_role() = 'admin'
+    ) THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'NOT_AUTHORIZED',
+            'message', 'You cannot view this submission'
+        );
+    END IF;
+
+    -- Legacy submissions still carry their text inline
+    IF v_submission.content_id IS NULL THEN
+        v_body := v_submission.translated_text;
+    ELSE
+        SELECT body INTO v_body
+        FROM submission_contents
+        WHERE id = v_submission.content_id;
+    END IF;
+
+    v_total := COALESCE(length(v_body), 0);
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'text', CASE
+            WHEN v_body IS NULL THEN NULL
+            WHEN p_length IS NULL THEN substr(v_body, p_offset + 1)
+            ELSE substr(v_body, p_offset + 1, p_length)
+        END,
+        'offset', p_offset,
+        'total_length', v_total
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- CRON JOB: Purge abandoned uploads daily
+-- =====================================================
+
+SELECT cron.schedule(
+    'submission-upload-cleanup',
+    '0 3 * * *',
+    $$DELETE FROM submission_uploads WHERE created_at < NOW() - INTERVAL '1 day'$$
+);
+
+-- Grant execute permissions
+-- Internal helpers: Supabase grants EXECUTE on new functions to anon and
+-- authenticated directly, so revoking from PUBLIC alone is not enough
+REVOKE EXECUTE ON FUNCTION check_submission_access(UUID, UUID) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION store_submission_content(UUID, UUID, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION create_submission(UUID, UUID, UUID, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_job(UUID, TEXT, TEXT, TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION begin_submission_upload(UUID, TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION append_submission_chunk(UUID, INTEGER, TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION submit_job_content(UUID, TEXT, UUID, UUID, INTEGER, TEXT, TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_submission_content(UUID, INTEGER, INTEGER) TO authenticated;
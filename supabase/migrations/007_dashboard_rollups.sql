@@ -0,0 +1,783 @@
+-- =====================================================
+-- Content Localization & AI Tutorial Platform
+-- Phase 2: Incremental Dashboard Rollups
+-- =====================================================
+
+-- Dashboard totals (jobs per status, payouts, lock-to-submit time,
+-- timeout rate) are kept in small rollup tables fed by a trigger on
+-- every job status transition and on price / assignee / owner edits, so
+-- reading them never scans jobs, submissions or job_history. The trigger
+-- only appends deltas, which a cron job folds into the rollups every
+-- minute; reads add the deltas still pending, so totals stay exact. The
+-- rollups are built at the end of this migration;
+-- backfill_job_rollups_batch() rebuilds them from current job state and
+-- job_history in keyset-paginated batches.
+--
+-- A rebuild takes lock / submit / timeout / release counts from
+-- job_history, while the trigger counts every status change. Transitions
+-- made without a history row (a direct UPDATE of jobs.status, as the
+-- jobs/submit page does) are therefore counted live but dropped by the
+-- next rebuild.
+
+-- =====================================================
+-- ROLLUP TABLES
+-- =====================================================
+
+-- Jobs per status, per creating manager
+CREATE TABLE job_status_rollups (
+    created_by UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    status job_status NOT NULL,
+    job_count BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (created_by, status)
+);
+
+-- Throughput and payouts, per creating manager
+CREATE TABLE job_flow_rollups (
+    created_by UUID PRIMARY KEY REFERENCES profiles(id) ON DELETE CASCADE,
+
+    -- Lock / submit throughput
+    locks_count BIGINT NOT NULL DEFAULT 0,
+    submits_count BIGINT NOT NULL DEFAULT 0,      -- locked -> submitted with a known lock time
+    lock_to_submit_seconds NUMERIC NOT NULL DEFAULT 0,
+
+    -- Locks that ended without a submission
+    timeouts_count BIGINT NOT NULL DEFAULT 0,     -- reverted by handle_job_timeouts()
+    releases_count BIGINT NOT NULL DEFAULT 0,     -- voluntarily released
+
+    -- Jobs in 'approved' or 'completed', valued at pricing_data->>'final_price'
+    paid_jobs_count BIGINT NOT NULL DEFAULT 0,
+    total_payout NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Payouts per CTV
+CREATE TABLE ctv_earnings_rollups (
+    user_id UUID PRIMARY KEY REFERENCES profiles(id) ON DELETE CASCADE,
+
+    paid_jobs_count BIGINT NOT NULL DEFAULT 0,
+    total_payout NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Pending deltas, one row per change. Status changes only ever INSERT
+-- here, so concurrent lock_job() calls on one manager's jobs never queue
+-- on a shared rollup row; merge_job_rollup_deltas() folds them in.
+CREATE TABLE job_status_rollup_deltas (
+    id BIGSERIAL PRIMARY KEY,
+    created_by UUID NOT NULL,
+    status job_status NOT NULL,
+    job_count BIGINT NOT NULL
+);
+
+CREATE TABLE job_flow_rollup_deltas (
+    id BIGSERIAL PRIMARY KEY,
+    created_by UUID NOT NULL,
+    locks_count BIGINT NOT NULL DEFAULT 0,
+    submits_count BIGINT NOT NULL DEFAULT 0,
+    lock_to_submit_seconds NUMERIC NOT NULL DEFAULT 0,
+    timeouts_count BIGINT NOT NULL DEFAULT 0,
+    releases_count BIGINT NOT NULL DEFAULT 0,
+    paid_jobs_count BIGINT NOT NULL DEFAULT 0,
+    total_payout NUMERIC(14, 2) NOT NULL DEFAULT 0.00
+);
+
+CREATE TABLE ctv_earnings_rollup_deltas (
+    id BIGSERIAL PRIMARY KEY,
+    user_id UUID NOT NULL,
+    paid_jobs_count BIGINT NOT NULL DEFAULT 0,
+    total_payout NUMERIC(14, 2) NOT NULL DEFAULT 0.00
+);
+
+-- Backfill progress (single row). While a backfill is running, the trigger
+-- skips jobs the backfill has not reached yet; their state is picked up
+-- when their batch is processed.
+CREATE TABLE job_rollup_backfill (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    in_progress BOOLEAN NOT NULL DEFAULT FALSE,
+    cursor_id UUID,
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+INSERT INTO job_rollup_backfill (id) VALUES (TRUE);
+
+-- Only reachable through the SECURITY DEFINER functions below
+ALTER TABLE job_status_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE job_flow_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE ctv_earnings_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE job_rollup_backfill ENABLE ROW LEVEL SECURITY;
+ALTER TABLE job_status_rollup_deltas ENABLE ROW LEVEL SECURITY;
+ALTER TABLE job_flow_rollup_deltas ENABLE ROW LEVEL SECURITY;
+ALTER TABLE ctv_earnings_rollup_deltas ENABLE ROW LEVEL SECURITY;
+
+-- =====================================================
+-- HELPER FUNCTIONS: Record deltas (insert-only)
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION bump_job_status_rollup(
+    p_created_by UUID,
+    p_status job_status,
+    p_delta BIGINT
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO job_status_rollup_deltas (created_by, status, job_count)
+    VALUES (p_created_by, p_status, p_delta);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION bump_job_flow_rollup(
+    p_created_by UUID,
+    p_locks BIGINT DEFAULT 0,
+    p_submits BIGINT DEFAULT 0,
+    p_lock_to_submit_seconds NUMERIC DEFAULT 0,
+    p_timeouts BIGINT DEFAULT 0,
+    p_releases BIGINT DEFAULT 0,
+    p_paid_jobs BIGINT DEFAULT 0,
+    p_payout NUMERIC DEFAULT 0
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO job_flow_rollup_deltas (
+        created_by, locks_count, submits_count, lock_to_submit_seconds,
+        timeouts_count, releases_count, paid_jobs_count, total_payout
+    )
+    VALUES (
+        p_created_by, p_locks, p_submits, p_lock_to_submit_seconds,
+        p_timeouts, p_releases, p_paid_jobs, p_payout
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION bump_ctv_earnings_rollup(
+    p_user_id UUID,
+    p_paid_jobs BIGINT,
+    p_payout NUMERIC
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO ctv_earnings_rollup_deltas (user_id, paid_jobs_count, total_payout)
+    VALUES (p_user_id, p_paid_jobs, p_payout);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: merge_job_rollup_deltas
+-- Folds pending deltas into the rollups (run by pg_cron)
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION merge_job_rollup_deltas()
+RETURNS JSONB AS $$
+DECLARE
+    v_merged INTEGER;
+    v_total INTEGER := 0;
+BEGIN
+    -- Each DELETE ... RETURNING moves its deltas atomically, so a reader
+    -- sees them either still pending or already merged, never both
+    WITH moved AS (
+        DELETE FROM job_status_rollup_deltas WHERE TRUE
+        RETURNING created_by, status, job_count
+    )
+    INSERT INTO job_status_rollups (created_by, status, job_count)
+    SELECT created_by, status, SUM(job_count)
+    FROM moved
+    GROUP BY created_by, status
+    ON CONFLICT (created_by, status) DO UPDATE
+    SET job_count = job_status_rollups.job_count + EXCLUDED.job_count;
+
+    GET DIAGNOSTICS v_merged = ROW_COUNT;
+    v_total := v_total + v_merged;
+
+    WITH moved AS (
+        DELETE FROM job_flow_rollup_deltas WHERE TRUE
+        RETURNING *
+    )
+    INSERT INTO job_flow_rollups (
+        created_by, locks_count, submits_count, lock_to_submit_seconds,
+        timeouts_count, releases_count, paid_jobs_count, total_payout
+    )
+    SELECT
+        created_by, SUM(locks_count), SUM(submits_count), SUM(lock_to_submit_seconds),
+        SUM(timeouts_count), SUM(releases_count), SUM(paid_jobs_count), SUM(total_payout)
+    FROM moved
+    GROUP BY created_by
+    ON CONFLICT (created_by) DO UPDATE
+    SET
+        locks_count = job_flow_rollups.locks_count + EXCLUDED.locks_count,
+        submits_count = job_flow_rollups.submits_count + EXCLUDED.submits_count,
+        lock_to_submit_seconds = job_flow_rollups.lock_to_submit_seconds + EXCLUDED.lock_to_submit_seconds,
+        timeouts_count = job_flow_rollups.timeouts_count + EXCLUDED.timeouts_count,
+        releases_count = job_flow_rollups.releases_count + EXCLUDED.releases_count,
+        paid_jobs_count = job_flow_rollups.paid_jobs_count + EXCLUDED.paid_jobs_count,
+        total_payout = job_flow_rollups.total_payout + EXCLUDED.total_payout,
+        updated_at = NOW();
+
+    GET DIAGNOSTICS v_merged = ROW_COUNT;
+    v_total := v_total + v_merged;
+
+    WITH moved AS (
+        DELETE FROM ctv_earnings_rollup_deltas WHERE TRUE
+        RETURNING user_id, paid_jobs_count, total_payout
+    )
+    INSERT INTO ctv_earnings_rollups (user_id, paid_jobs_count, total_payout)
+    SELECT user_id, SUM(paid_jobs_count), SUM(total_payout)
+    FROM moved
+    GROUP BY user_id
+    ON CONFLICT (user_id) DO UPDATE
+    SET
+        paid_jobs_count = ctv_earnings_rollups.paid_jobs_count + EXCLUDED.paid_jobs_count,
+        total_payout = ctv_earnings_rollups.total_payout + EXCLUDED.total_payout,
+        updated_at = NOW();
+
+    GET DIAGNOSTICS v_merged = ROW_COUNT;
+    v_total := v_total + v_merged;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'rollups_updated', v_total
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- HELPER FUNCTION: Throughput of jobs, replayed from job_history
+-- Used by the backfill and to take deleted jobs back out
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION replay_job_flow(p_job_ids UUID[])
+RETURNS TABLE (
+    created_by UUID,
+    locks_count BIGINT,
+    submits_count BIGINT,
+    lock_to_submit_seconds NUMERIC,
+    timeouts_count BIGINT,
+    releases_count BIGINT
+) AS $$
+    SELECT
+        j.created_by,
+        COUNT(*) FILTER (WHERE h.new_status = 'locked'),
+        COUNT(l.created_at),
+        COALESCE(SUM(EXTRACT(EPOCH FROM h.created_at - l.created_at)), 0),
+        COUNT(*) FILTER (
+            WHERE h.previous_status = 'locked' AND h.new_status = 'available'
+            AND h.changed_by IS NULL
+        ),
+        COUNT(*) FILTER (
+            WHERE h.previous_status = 'locked' AND h.new_status = 'available'
+            AND h.changed_by IS NOT NULL
+        )
+    FROM job_history h
+    JOIN jobs j ON j.id = h.job_id
+    LEFT JOIN LATERAL (
+        SELECT lh.created_at
+        FROM job_history lh
+        WHERE lh.job_id = h.job_id
+        AND lh.new_status = 'locked'
+        AND lh.created_at <= h.created_at
+        ORDER BY lh.created_at DESC
+        LIMIT 1
+    ) l ON h.previous_status = 'locked' AND h.new_status = 'submitted'
+    WHERE h.job_id = ANY(p_job_ids)
+    GROUP BY j.created_by;
+$$ LANGUAGE sql STABLE;
+
+-- =====================================================
+-- FUNCTION: apply_job_rollups (trigger)
+-- Applies one job insert or tracked change to the rollups
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION apply_job_rollups()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_job_id UUID;
+    v_backfill RECORD;
+    v_was_paid BOOLEAN;
+    v_is_paid BOOLEAN;
+    v_price NUMERIC;
+BEGIN
+    v_job_id := NEW.id;
+
+    SELECT in_progress, cursor_id INTO v_backfill
+    FROM job_rollup_backfill;
+
+    -- Not yet reached by a running backfill
+    IF v_backfill.in_progress
+       AND (v_backfill.cursor_id IS NULL OR v_job_id > v_backfill.cursor_id) THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_job_status_rollup(NEW.created_by, NEW.status, 1);
+        RETURN NULL;
+    END IF;
+
+    -- UPDATE of status, pricing, assignee or owner
+    IF OLD.status IS DISTINCT FROM NEW.status
+       OR OLD.created_by IS DISTINCT FROM NEW.created_by THEN
+        PERFORM bump_job_status_rollup(OLD.created_by, OLD.status, -1);
+        PERFORM bump_job_status_rollup(NEW.created_by, NEW.status, 1);
+    END IF;
+
+    IF OLD.status IS DISTINCT FROM NEW.status THEN
+        IF NEW.status = 'locked' THEN
+            PERFORM bump_job_flow_rollup(NEW.created_by, p_locks => 1);
+        ELSIF OLD.status = 'locked' AND NEW.status = 'submitted' AND OLD.locked_at IS NOT NULL THEN
+            PERFORM bump_job_flow_rollup(
+                NEW.created_by,
+                p_submits => 1,
+                p_lock_to_submit_seconds => EXTRACT(EPOCH FROM NOW() - OLD.locked_at)
+            );
+        ELSIF OLD.status = 'locked' AND NEW.status = 'available' THEN
+            -- Same rule as job_history: no acting user means handle_job_timeouts()
+            IF auth.uid() IS NULL THEN
+                PERFORM bump_job_flow_rollup(NEW.created_by, p_timeouts => 1);
+            ELSE
+                PERFORM bump_job_flow_rollup(NEW.created_by, p_releases => 1);
+            END IF;
+        END IF;
+    END IF;
+
+    -- Payouts: take out the old contribution of a paid job, add the new one
+    v_was_paid := OLD.status IN ('approved', 'completed');
+    v_is_paid := NEW.status IN ('approved', 'completed');
+
+    IF v_was_paid AND v_is_paid
+       AND OLD.pricing_data->>'final_price' IS NOT DISTINCT FROM NEW.pricing_data->>'final_price'
+       AND OLD.locked_by IS NOT DISTINCT FROM NEW.locked_by
+       AND OLD.created_by IS NOT DISTINCT FROM NEW.created_by THEN
+        RETURN NULL;
+    END IF;
+
+    IF v_was_paid THEN
+        v_price := COALESCE((OLD.pricing_data->>'final_price')::NUMERIC, 0);
+        PERFORM bump_job_flow_rollup(OLD.created_by, p_paid_jobs => -1, p_payout => -v_price);
+        IF OLD.locked_by IS NOT NULL THEN
+            PERFORM bump_ctv_earnings_rollup(OLD.locked_by, -1, -v_price);
+        END IF;
+    END IF;
+
+    IF v_is_paid THEN
+        v_price := COALESCE((NEW.pricing_data->>'final_price')::NUMERIC, 0);
+        PERFORM bump_job_flow_rollup(NEW.created_by, p_paid_jobs => 1, p_payout => v_price);
+        IF NEW.locked_by IS NOT NULL THEN
+            PERFORM bump_ctv_earnings_rollup(NEW.locked_by, 1, v_price);
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER jobs_rollups_insert
+    AFTER INSERT ON jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION apply_job_rollups();
+
+CREATE TRIGGER jobs_rollups_status_change
+    AFTER UPDATE OF status, pricing_data, locked_by, created_by ON jobs
+    FOR EACH ROW
+    WHEN (
+        OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.pricing_data->>'final_price' IS DISTINCT FROM NEW.pricing_data->>'final_price'
+        OR OLD.locked_by IS DISTINCT FROM NEW.locked_by
+        OR OLD.created_by IS DISTINCT FROM NEW.created_by
+    )
+    EXECUTE FUNCTION apply_job_rollups();
+
+-- =====================================================
+-- FUNCTION: remove_job_rollups (trigger)
+-- Takes a deleted job back out of the rollups, as a
+-- rebuild would no longer see it
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION remove_job_rollups()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_backfill RECORD;
+    v_flow RECORD;
+    v_price NUMERIC;
+BEGIN
+    SELECT in_progress, cursor_id INTO v_backfill
+    FROM job_rollup_backfill;
+
+    -- Not yet reached by a running backfill
+    IF v_backfill.in_progress
+       AND (v_backfill.cursor_id IS NULL OR OLD.id > v_backfill.cursor_id) THEN
+        RETURN OLD;
+    END IF;
+
+    PERFORM bump_job_status_rollup(OLD.created_by, OLD.status, -1);
+
+    IF OLD.status IN ('approved', 'completed') THEN
+        v_price := COALESCE((OLD.pricing_data->>'final_price')::NUMERIC, 0);
+        PERFORM bump_job_flow_rollup(OLD.created_by, p_paid_jobs => -1, p_payout => -v_price);
+        IF OLD.locked_by IS NOT NULL THEN
+            PERFORM bump_ctv_earnings_rollup(OLD.locked_by, -1, -v_price);
+        END IF;
+    END IF;
+
+    -- Runs BEFORE DELETE, while the job's history (removed by
+    -- ON DELETE CASCADE) is still there to replay
+    FOR v_flow IN SELECT * FROM replay_job_flow(ARRAY[OLD.id]) LOOP
+        PERFORM bump_job_flow_rollup(
+            v_flow.created_by,
+            p_locks => -v_flow.locks_count,
+            p_submits => -v_flow.submits_count,
+            p_lock_to_submit_seconds => -v_flow.lock_to_submit_seconds,
+            p_timeouts => -v_flow.timeouts_count,
+            p_releases => -v_flow.releases_count
+        );
+    END LOOP;
+
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER jobs_rollups_delete
+    BEFORE DELETE ON jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION remove_job_rollups();
+
+-- =====================================================
+-- FUNCTION: start_job_rollups_backfill
+-- Clears the rollups and rewinds the backfill cursor
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION start_job_rollups_backfill()
+RETURNS JSONB AS $$
+BEGIN
+    -- From here on the trigger skips every job until its batch is reached
+    UPDATE job_rollup_backfill
+    SET
+        in_progress = TRUE,
+        cursor_id = NULL,
+        started_at = NOW(),
+        finished_at = NULL
+    WHERE id;
+
+    -- Qualified so pg_safeupdate accepts them over PostgREST
+    DELETE FROM job_status_rollups WHERE TRUE;
+    DELETE FROM job_flow_rollups WHERE TRUE;
+    DELETE FROM ctv_earnings_rollups WHERE TRUE;
+    DELETE FROM job_status_rollup_deltas WHERE TRUE;
+    DELETE FROM job_flow_rollup_deltas WHERE TRUE;
+    DELETE FROM ctv_earnings_rollup_deltas WHERE TRUE;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'message', 'Backfill started',
+        'started_at', NOW()
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: backfill_job_rollups_batch
+-- Folds the next batch of jobs (by id) into the rollups
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION backfill_job_rollups_batch(p_batch_size INTEGER DEFAULT 1000)
+RETURNS JSONB AS $$
+DECLARE
+    v_cursor UUID;
+    v_in_progress BOOLEAN;
+    v_ids UUID[];
+    v_count INTEGER;
+BEGIN
+    SELECT in_progress, cursor_id INTO v_in_progress, v_cursor
+    FROM job_rollup_backfill
+    FOR UPDATE;
+
+    IF NOT v_in_progress THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'BACKFILL_NOT_STARTED',
+            'message', 'Call start_job_rollups_backfill() first'
+        );
+    END IF;
+
+    -- FOR SHARE waits for in-flight status changes on the batch so none
+    -- are missed between this snapshot and the cursor moving past them
+    SELECT array_agg(id ORDER BY id) INTO v_ids
+    FROM (
+        SELECT id FROM jobs
+        WHERE v_cursor IS NULL OR id > v_cursor
+        ORDER BY id
+        LIMIT p_batch_size
+        FOR SHARE
+    ) batch;
+
+    v_count := COALESCE(array_length(v_ids, 1), 0);
+
+    IF v_count > 0 THEN
+        -- Jobs per status
+        INSERT INTO job_status_rollups (created_by, status, job_count)
+        SELECT created_by, status, COUNT(*)
+        FROM jobs
+        WHERE id = ANY(v_ids)
+        GROUP BY created_by, status
+        ON CONFLICT (created_by, status) DO UPDATE
+        SET job_count = job_status_rollups.job_count + EXCLUDED.job_count;
+
+        -- Throughput, replayed from job_history
+        INSERT INTO job_flow_rollups (
+            created_by, locks_count, submits_count, lock_to_submit_seconds,
+            timeouts_count, releases_count
+        )
+        SELECT * FROM replay_job_flow(v_ids)
+        ON CONFLICT (created_by) DO UPDATE
+        SET
+            locks_count = job_flow_rollups.locks_count + EXCLUDED.locks_count,
+            submits_count = job_flow_rollups.submits_count + EXCLUDED.submits_count,
+            lock_to_submit_seconds = job_flow_rollups.lock_to_submit_seconds + EXCLUDED.lock_to_submit_seconds,
+            timeouts_count = job_flow_rollups.timeouts_count + EXCLUDED.timeouts_count,
+            releases_count = job_flow_rollups.releases_count + EXCLUDED.releases_count,
+            updated_at = NOW();
+
+        -- Payouts per manager
+        INSERT INTO job_flow_rollups (created_by, paid_jobs_count, total_payout)
+        SELECT created_by, COUNT(*), SUM(COALESCE((pricing_data->>'final_price')::NUMERIC, 0))
+        FROM jobs
+        WHERE id = ANY(v_ids)
+        AND status IN ('approved', 'completed')
+        GROUP BY created_by
+        ON CONFLICT (created_by) DO UPDATE
+        SET
+            paid_jobs_count = job_flow_rollups.paid_jobs_count + EXCLUDED.paid_jobs_count,
+            total_payout = job_flow_rollups.total_payout + EXCLUDED.total_payout,
+            updated_at = NOW();
+
+        -- Payouts per CTV
+        INSERT INTO ctv_earnings_rollups (user_id, paid_jobs_count, total_payout)
+        SELECT locked_by, COUNT(*), SUM(COALESCE((pricing_data->>'final_price')::NUMERIC, 0))
+        FROM jobs
+        WHERE id = ANY(v_ids)
+        AND status IN ('approved', 'completed')
+        AND locked_by IS NOT NULL
+        GROUP BY locked_by
+        ON CONFLICT (user_id) DO UPDATE
+        SET
+            paid_jobs_count = ctv_earnings_rollups.paid_jobs_count + EXCLUDED.paid_jobs_count,
+            total_payout = ctv_earnings_rollups.total_payout + EXCLUDED.total_payout,
+            updated_at = NOW();
+
+        v_cursor := v_ids[v_count];
+    END IF;
+
+    IF v_count < p_batch_size THEN
+        UPDATE job_rollup_backfill
+        SET
+            in_progress = FALSE,
+            cursor_id = NULL,
+            finished_at = NOW()
+        WHERE id;
+    ELSE
+        UPDATE job_rollup_backfill
+        SET cursor_id = v_cursor
+        WHERE id;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'processed', v_count,
+        'cursor', v_cursor,
+        'done', v_count < p_batch_size
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: get_dashboard_rollups
+-- Dashboard aggregates for admins (all or one manager)
+-- and managers (own jobs only)
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION get_dashboard_rollups(p_manager_id UUID DEFAULT NULL)
+RETURNS JSONB AS $$
+DECLARE
+    v_role user_role;
+    v_status_counts JSONB;
+    v_pending_review BIGINT;
+    v_flow RECORD;
+BEGIN
+    v_role := get_user_role();
+
+    IF v_role = 'manager' THEN
+        -- Managers only ever see their own jobs
+        p_manager_id := auth.uid();
+    ELSIF v_role IS DISTINCT FROM 'admin' THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'NOT_AUTHORIZED',
+            'message', 'Only managers and admins can view dashboard stats'
+        );
+    END IF;
+
+    -- Each read adds the deltas not merged yet, in the same statement
+    SELECT COALESCE(jsonb_object_agg(status, job_count), '{}'::jsonb)
+    INTO v_status_counts
+    FROM (
+        SELECT status, SUM(job_count) AS job_count
+        FROM (
+            SELECT created_by, status, job_count FROM job_status_rollups
+            UNION ALL
+            SELECT created_by, status, job_count FROM job_status_rollup_deltas
+        ) r
+        WHERE p_manager_id IS NULL OR created_by = p_manager_id
+        GROUP BY status
+    ) counts;
+
+    -- The review queue is shared across managers
+    SELECT COALESCE(SUM(job_count), 0) INTO v_pending_review
+    FROM (
+        SELECT status, job_count FROM job_status_rollups
+        UNION ALL
+        SELECT status, job_count FROM job_status_rollup_deltas
+    ) r
+    WHERE status = 'submitted';
+
+    SELECT
+        COALESCE(SUM(locks_count), 0) AS locks_count,
+        COALESCE(SUM(submits_count), 0) AS submits_count,
+        COALESCE(SUM(lock_to_submit_seconds), 0) AS lock_to_submit_seconds,
+        COALESCE(SUM(timeouts_count), 0) AS timeouts_count,
+        COALESCE(SUM(releases_count), 0) AS releases_count,
+        COALESCE(SUM(paid_jobs_count), 0) AS paid_jobs_count,
+        COALESCE(SUM(total_payout), 0) AS total_payout
+    INTO v_flow
+    FROM (
+        SELECT
+            created_by, locks_count, submits_count, lock_to_submit_seconds,
+            timeouts_count, releases_count, paid_jobs_count, total_payout
+        FROM job_flow_rollups
+        UNION ALL
+        SELECT
+            created_by, locks_count, submits_count, lock_to_submit_seconds,
+            timeouts_count, releases_count, paid_jobs_count, total_payout
+        FROM job_flow_rollup_deltas
+    ) r
+    WHERE p_manager_id IS NULL OR created_by = p_manager_id;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'manager_id', p_manager_id,
+        'status_counts', v_status_counts,
+        'pending_review', v_pending_review,
+        'locks_count', v_flow.locks_count,
+        'submits_count', v_flow.submits_count,
+        'avg_lock_to_submit_seconds', CASE
+            WHEN v_flow.submits_count > 0
+            THEN ROUND(v_flow.lock_to_submit_seconds / v_flow.submits_count)
+        END,
+        'timeouts_count', v_flow.timeouts_count,
+        'releases_count', v_flow.releases_count,
+        'timeout_rate', CASE
+            WHEN v_flow.locks_count > 0
+            THEN ROUND(v_flow.timeouts_count::NUMERIC / v_flow.locks_count, 4)
+            ELSE 0
+        END,
+        'paid_jobs_count', v_flow.paid_jobs_count,
+        'total_payout', v_flow.total_payout,
+        'backfill_in_progress', (SELECT in_progress FROM job_rollup_backfill)
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- FUNCTION: get_ctv_earnings
+-- Payout totals per CTV (CTVs can only see their own)
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION get_ctv_earnings(
+    p_user_id UUID DEFAULT NULL,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_role user_role;
+BEGIN
+    v_role := get_user_role();
+
+    IF v_role = 'ctv' THEN
+        p_user_id := auth.uid();
+    ELSIF v_role IS NULL THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'NOT_AUTHENTICATED',
+            'message', 'User must be authenticated'
+        );
+    END IF;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'earnings', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'user_id', e.user_id,
+                'full_name', p.full_name,
+                'paid_jobs_count', e.paid_jobs_count,
+                'total_payout', e.total_payout
+            ) ORDER BY e.total_payout DESC)
+            FROM (
+                SELECT user_id, SUM(paid_jobs_count) AS paid_jobs_count, SUM(total_payout) AS total_payout
+                FROM (
+                    SELECT user_id, paid_jobs_count, total_payout FROM ctv_earnings_rollups
+                    UNION ALL
+                    SELECT user_id, paid_jobs_count, total_payout FROM ctv_earnings_rollup_deltas
+                ) r
+                WHERE p_user_id IS NULL OR user_id = p_user_id
+                GROUP BY user_id
+                ORDER BY total_payout DESC, user_id
+                LIMIT p_limit OFFSET p_offset
+            ) e
+            JOIN profiles p ON p.id = e.user_id
+        ), '[]'::jsonb)
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- INITIAL BUILD
+-- Existing jobs are folded in here so the rollups are
+-- correct as soon as the trigger starts applying deltas
+-- =====================================================
+
+SELECT start_job_rollups_backfill();
+
+DO $$
+BEGIN
+    LOOP
+        EXIT WHEN (backfill_job_rollups_batch(5000)->>'done')::BOOLEAN;
+    END LOOP;
+END;
+$$;
+
+-- =====================================================
+-- CRON JOB: Merge pending deltas every minute
+-- =====================================================
+
+SELECT cron.schedule(
+    'job-rollups-merge',
+    '* * * * *',
+    $$SELECT merge_job_rollup_deltas()$$
+);
+
+-- Internal helpers and backfill are not callable by clients. Supabase
+-- grants EXECUTE on new functions to anon and authenticated directly, so
+-- they are revoked from those roles as well as PUBLIC.
+REVOKE EXECUTE ON FUNCTION bump_job_status_rollup(UUID, job_status, BIGINT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION bump_job_flow_rollup(UUID, BIGINT, BIGINT, NUMERIC, BIGINT, BIGINT, BIGINT, NUMERIC) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION bump_ctv_earnings_rollup(UUID, BIGINT, NUMERIC) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION replay_job_flow(UUID[]) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION merge_job_rollup_deltas() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION start_job_rollups_backfill() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION backfill_job_rollups_batch(INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- Grant execute permissions
+GRANT EXECUTE ON FUNCTION start_job_rollups_backfill() TO service_role;
+GRANT EXECUTE ON FUNCTION backfill_job_rollups_batch(INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION get_dashboard_rollups(UUID) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_ctv_earnings(UUID, INTEGER, INTEGER) TO authenticated;
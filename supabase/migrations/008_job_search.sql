@@ -0,0 +1,171 @@
+-- =====================================================
+-- Content Localization & AI Tutorial Platform
+-- Phase 2: Job Search (Full-text + Trigram)
+-- =====================================================
+
+-- CTVs search jobs by tool or model ("ComfyUI", "Stable Diffusion").
+-- Full-text matching uses a generated tsvector over the title,
+-- description and AI metadata. When that finds nothing, trigram word
+-- similarity over the title and tool names catches partial words and
+-- typos ("comfy", "stable difusion").
+-- Both are GIN-indexed, and the empty-query listing walks a created_at
+-- index, so no search path scans the whole jobs table.
+
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+-- =====================================================
+-- SEARCH VECTOR COLUMN
+-- 'simple' config: content mixes Vietnamese and tool names, neither of
+-- which benefits from English stemming
+-- =====================================================
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', COALESCE(title, '')), 'A')
+        || setweight(jsonb_to_tsvector('simple', COALESCE(ai_metadata->'ai_tools_used', '[]'::jsonb), '["string"]'), 'A')
+        || setweight(to_tsvector('simple', COALESCE(ai_metadata->>'tutorial_type', '')), 'B')
+        || setweight(to_tsvector('simple', COALESCE(description, '')), 'C')
+        || setweight(jsonb_to_tsvector('simple', COALESCE(ai_metadata->'model_links', '[]'::jsonb), '["string"]'), 'D')
+    ) STORED;
+
+CREATE INDEX idx_jobs_search_vector ON jobs USING GIN (search_vector);
+
+-- =====================================================
+-- HELPER FUNCTION: Text used for trigram matching
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION job_search_text(p_title TEXT, p_ai_metadata JSONB)
+RETURNS TEXT AS $$
+    SELECT lower(
+        COALESCE(p_title, '') || ' '
+        || COALESCE(p_ai_metadata->>'tutorial_type', '') || ' '
+        || COALESCE((p_ai_metadata->'ai_tools_used')::TEXT, '')
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE INDEX idx_jobs_search_trgm ON jobs USING GIN (job_search_text(title, ai_metadata) gin_trgm_ops);
+
+-- Filters applied alongside search. Replaces idx_jobs_status, which
+-- shares its leading column.
+CREATE INDEX idx_jobs_status_complexity ON jobs(status, complexity);
+DROP INDEX IF EXISTS idx_jobs_status;
+
+-- Empty-query listing, newest first, with and without a status filter
+CREATE INDEX idx_jobs_status_created_at ON jobs(status, created_at DESC, id);
+CREATE INDEX idx_jobs_created_at ON jobs(created_at DESC, id);
+
+-- =====================================================
+-- FUNCTION: search_jobs
+-- Ranked, paginated search. Runs as the caller, so the
+-- jobs RLS policies decide which jobs are visible.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION search_jobs(
+    p_query TEXT,
+    p_status job_status DEFAULT 'available',
+    p_complexity complexity_level DEFAULT NULL,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    description TEXT,
+    source_url TEXT,
+    word_count INTEGER,
+    video_duration_seconds INTEGER,
+    is_re_record_required BOOLEAN,
+    complexity complexity_level,
+    pricing_data JSONB,
+    ai_metadata JSONB,
+    status job_status,
+    locked_by UUID,
+    deadline TIMESTAMPTZ,
+    created_at TIMESTAMPTZ,
+    rank REAL
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_query TEXT;
+    v_tsquery TSQUERY;
+BEGIN
+    v_query := lower(btrim(COALESCE(p_query, '')));
+
+    -- No search terms: plain filtered listing, newest first
+    IF v_query = '' THEN
+        RETURN QUERY
+        SELECT
+            j.id, j.title, j.description, j.source_url, j.word_count,
+            j.video_duration_seconds, j.is_re_record_required, j.complexity,
+            j.pricing_data, j.ai_metadata, j.status, j.locked_by, j.deadline,
+            j.created_at, 0::REAL
+        FROM jobs j
+        WHERE (p_status IS NULL OR j.status = p_status)
+        AND (p_complexity IS NULL OR j.complexity = p_complexity)
+        ORDER BY j.created_at DESC, j.id
+        LIMIT p_limit OFFSET p_offset;
+        RETURN;
+    END IF;
+
+    v_tsquery := websearch_to_tsquery('simple', v_query);
+
+    -- Full-text matches win; trigram is only the fallback for partial
+    -- words and typos. Keeping the two apart lets each use its own index
+    -- (an OR of both ends up filtering every row with the status).
+    -- Matches are ranked on (id, rank) alone and only the requested page
+    -- is joined back for the full rows, so deep pages sort narrow tuples.
+    RETURN QUERY
+    SELECT
+        j.id, j.title, j.description, j.source_url, j.word_count,
+        j.video_duration_seconds, j.is_re_record_required, j.complexity,
+        j.pricing_data, j.ai_metadata, j.status, j.locked_by, j.deadline,
+        j.created_at, r.rank
+    FROM (
+        SELECT m.id, m.created_at, ts_rank_cd(m.search_vector, v_tsquery)::REAL AS rank
+        FROM jobs m
+        WHERE m.search_vector @@ v_tsquery
+        AND (p_status IS NULL OR m.status = p_status)
+        AND (p_complexity IS NULL OR m.complexity = p_complexity)
+        ORDER BY rank DESC, m.created_at DESC, m.id
+        LIMIT p_limit OFFSET p_offset
+    ) r
+    JOIN jobs j ON j.id = r.id
+    ORDER BY r.rank DESC, r.created_at DESC, r.id;
+
+    IF FOUND THEN
+        RETURN;
+    END IF;
+
+    -- An empty page past the last full-text match stays empty, so paging
+    -- never switches from full-text to trigram results
+    IF p_offset > 0 AND EXISTS (
+        SELECT 1 FROM jobs j
+        WHERE j.search_vector @@ v_tsquery
+        AND (p_status IS NULL OR j.status = p_status)
+        AND (p_complexity IS NULL OR j.complexity = p_complexity)
+    ) THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        j.id, j.title, j.description, j.source_url, j.word_count,
+        j.video_duration_seconds, j.is_re_record_required, j.complexity,
+        j.pricing_data, j.ai_metadata, j.status, j.locked_by, j.deadline,
+        j.created_at, r.rank
+    FROM (
+        SELECT m.id, m.created_at, word_similarity(v_query, job_search_text(m.title, m.ai_metadata))::REAL AS rank
+        FROM jobs m
+        WHERE v_query <% job_search_text(m.title, m.ai_metadata)
+        AND (p_status IS NULL OR m.status = p_status)
+        AND (p_complexity IS NULL OR m.complexity = p_complexity)
+        ORDER BY rank DESC, m.created_at DESC, m.id
+        LIMIT p_limit OFFSET p_offset
+    ) r
+    JOIN jobs j ON j.id = r.id
+    ORDER BY r.rank DESC, r.created_at DESC, r.id;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Grant execute permissions
+GRANT EXECUTE ON FUNCTION search_jobs(TEXT, job_status, complexity_level, INTEGER, INTEGER) TO authenticated;